@@ -5,19 +5,21 @@ import builtins
 import shelve
 import re
 import operator
+import weakref
 import typing as T
 
 
 def show_table(items: dict):
     """Print the gven dict as a table where keys are headers and
     values are sequences of the items in rows"""
-    lengths = [max(len(x) for x in items[k]+[k])+3 for k in items]
-    print('|'.join(k.ljust(lengths[i]) for i, k in enumerate(items)))
+    headers = list(items)
+    columns = list(items.values())
+    lengths = [max(len(x) for x in col+[h])+3 for col, h in zip(columns, headers)]
+    print('|'.join(h.ljust(n) for h, n in zip(headers, lengths)))
     print('-'*(sum(lengths)+len(items)-1))
-    
-    for i in range(len(next(iter(items.values())))):
-        print('|'.join(items[k][i].ljust(lengths[j])
-                       for j, k in enumerate(items)))
+
+    for row in zip(*columns):
+        print('|'.join(cell.ljust(n) for cell, n in zip(row, lengths)))
 
 
 def multiline_input(prompt='... ', end='\x04'):
@@ -27,11 +29,12 @@ def multiline_input(prompt='... ', end='\x04'):
 
 def only_classmethods(cls):
     """convert all normal methods to classmethods"""
-    for k, v in cls.__dict__.items():
-        if (not k.startswith('__')
-                and callable(v)
-                and not isinstance(v, (classmethod, staticmethod))):
-            setattr(cls, k, classmethod(v))
+    converted = [(k, classmethod(v)) for k, v in cls.__dict__.items()
+                 if (not k.startswith('__')
+                     and callable(v)
+                     and not isinstance(v, (classmethod, staticmethod)))]
+    for k, v in converted:
+        setattr(cls, k, v)
     return cls
 
 
@@ -53,18 +56,23 @@ def threadsafe_class(name: str = 'lock', exclude: T.Container[str] =
     """wrap all class attributes passing `check` (default: `callable`) with `threadsafe_method`
 
     `exclude` may contain names not to wrap. Only `cls.__dict__` is checked.
-    if `wrap_init` is truthly, __init__ will be wrapped to setattr(self, name, wrap_init())"""
+    if `wrap_init` is truthly, __init__ will be wrapped to setattr(self, name, wrap_init())
+    The default is a re-entrant lock, so wrapped methods may call each other"""
     def modifier(cls):
+        make_threadsafe = threadsafe_method(name=name)
+        wrapped = []
         for k, v in cls.__dict__.items():
             if check(v) and k not in exclude:
-                setattr(cls, k, threadsafe_method(name=name)(v))
-            if wrap_init and k == '__init__':
-                __init__method = v
-                @functools.wraps(v)
-                def wrapper(self, *args, **kwargs):
-                    setattr(self, name, wrap_init())
-                    return __init__method(self, *args, **kwargs)
-                setattr(cls, '__init__', wrapper)
+                wrapped.append((k, make_threadsafe(v)))
+        orig_init = cls.__dict__.get('__init__')
+        if wrap_init and orig_init is not None:
+            @functools.wraps(orig_init)
+            def wrapper(self, *args, _orig_init=orig_init, **kwargs):
+                setattr(self, name, wrap_init())
+                return _orig_init(self, *args, **kwargs)
+            wrapped.append(('__init__', wrapper))
+        for k, v in wrapped:
+            setattr(cls, k, v)
         return cls
     return modifier
 
@@ -182,14 +190,26 @@ class Instance:
 
 
 class Tree:
+    # classes are only kept while in use, value types may be temporary
+    _derived_classes = weakref.WeakValueDictionary()
+
+    @staticmethod
+    def _derived_class(value_type):
+        """get the (cached) Tree subclass for `value_type`"""
+        try:
+            return Tree._derived_classes[value_type]
+        except KeyError:
+            derived = type('<DerivedTreeNode: {}>'.format(value_type),
+                           (Tree, value_type), {})
+            Tree._derived_classes[value_type] = derived
+            return derived
+
     @classmethod
     def new(cls, value):
-        return type('<DerivedTreeNode: {}>'.format(type(value)),
-                    (Tree, type(value)), {})(value)
+        return Tree._derived_class(type(value))(value)
 
     def __setattr__(self, name, value):
-        object.__setattr__(self, name, type(
-            '<DerivedTreeNode: {}>'.format(type(value)), (Tree, type(value)), {})(value))
+        object.__setattr__(self, name, Tree._derived_class(type(value))(value))
 
 
 class SocketFile:
@@ -4,18 +4,165 @@ Most of these are developed "on the go", so only the methods I actually
 use(d) will be overridden (if applicable)
 """
 
+import collections
+import operator
+import types
+import weakref
 import tkinter as tk
 import tkinter.ttk as ttk
-# __init__ imports the modules __init__ method
-# get the instance with __self__
-from .. import __init__
-misc = __init__.__self__
-del __init__
 
 GEOMETRY_MANAGERS = ('grid', 'pack', 'place')
 GEOMETRY_MANAGERS_FORGET = [(n, n + '_forget') for n in GEOMETRY_MANAGERS]
+# attributes set on widget instances by tkinter.BaseWidget
+WIDGET_INSTANCE_ATTRIBUTES = ('master', 'tk', 'children', 'widgetName',
+                              '_name', '_w')
+# Tcl procedure gridding (<path>, <row>, <column>) triples in a single call
+_GRID_MANY = 'misc_tkstuff_grid_many'
+_GRID_MANY_PROC = ('proc misc_tkstuff_grid_many args'
+                   ' {foreach {w r c} $args {grid configure $w -row $r -column $c}}')
+
+WidgetSpec = collections.namedtuple('WidgetSpec', 'cls args kwargs')
+WidgetSpec.__doc__ = """Specification of a widget to be created
+
+    May be used instead of the (<class>, <kwargs>) form, in which case
+    positional arguments don't have to be passed under the key '*args'
+    """
+
+
+class _BaseAttribute:
+    """Delegate an attribute lookup to the `.base` of the instance
+
+    Instance attributes of the same name still take precedence
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return getattr(instance.base, self.name)
+
+
+def _base_attributes(cls):
+    """Class decorator delegating WIDGET_INSTANCE_ATTRIBUTES to `.base`"""
+    for name in WIDGET_INSTANCE_ATTRIBUTES:
+        setattr(cls, name, _BaseAttribute(name))
+    return cls
+
+
+def _geometry_methods(factory):
+    """Class decorator adding the geometry manager methods created by `factory`
+
+    `factory` is called with the name of each geometry manager method
+        and the name of the corresponding forget method and returns both
+    """
+    def decorator(cls):
+        for name, forget in GEOMETRY_MANAGERS_FORGET:
+            for method_name, method in zip((name, forget), factory(name, forget)):
+                method.__name__ = method_name
+                method.__qualname__ = '{}.{}'.format(cls.__qualname__, method_name)
+                setattr(cls, method_name, method)
+        return cls
+    return decorator
+
+
+def _plain_new(cls, *si, **nk):
+    """__new__ ignoring its arguments, for classes using object.__new__"""
+    return object.__new__(cls)
+
+
+def _grid_many(interp, triples):
+    """.grid() the flattened (<path>, <row>, <column>) `triples` in one call
+
+    the Tcl procedure is defined in an interpreter when it is first needed
+    """
+    try:
+        interp.call(_GRID_MANY, *triples)
+    except tk.TclError:
+        if interp.call('info', 'commands', _GRID_MANY):
+            raise
+        interp.eval(_GRID_MANY_PROC)
+        interp.call(_GRID_MANY, *triples)
+
+
+# (x, y) step on the grid for the first element of a direction
+_DIRECTION_STEPS = {tk.RIGHT: (1, 0), tk.LEFT: (-1, 0),
+                    tk.TOP: (0, -1), tk.BOTTOM: (0, 1)}
+
+
+def _grid_coordinates(direction, horizontal, vertical, count):
+    """Return the (x, y) grid positions of `count` widgets
+
+    see ContainingWidget.__init__ for the arguments
+    """
+    directions = frozenset(direction)
+    # x and y Start and Increment
+    if tk.RIGHT in directions:
+        xs = 0
+        xi = 1
+    elif tk.LEFT in directions:
+        if horizontal:
+            xs = horizontal - 1
+        else:
+            xs = count - 1
+        xi = -1
+    else:
+        raise ValueError('`direction` must be of the form specified in __init__')
+    if tk.TOP in directions:
+        if vertical:
+            ys = vertical - 1
+        else:
+            ys = count - 1
+        yi = -1
+    elif tk.BOTTOM in directions:
+        ys = 0
+        yi = 1
+    else:
+        raise ValueError('`direction` must be of the form specified in __init__')
+    # with both checks above passed, direction[0] is one of the keys
+    dx, dy = _DIRECTION_STEPS[direction[0]]
+    x_wrap = (-1, horizontal or None)
+    y_wrap = (-1, vertical or None)
+    coords = []
+    x, y = xs, ys
+    for __ in range(count):
+        coords.append((x, y))
+        x += dx
+        y += dy
+        if y in y_wrap:
+            y = ys
+            x += xi
+        if x in x_wrap:
+            x = xs
+            y += yi
+    return coords
+
+
+def _containing_geometry_methods(name, forget):
+    """geometry manager methods for ContainingWidget"""
+    def wrapper(self, *args, rcoords=None, **kwargs):
+        getattr(self.base, name)(*args, **kwargs)
+        return self.grid_subwidgets(rcoords)
+    wrapper.__doc__ = """.{}() the base widget and .grid() the subwidgets.
+
+                        respect the directions given in __init__
+                        pass *args and **kwargs to the base widget
+                        """.format(name)
+
+    base_forget = operator.methodcaller(forget)
+
+    def forgetter(self, exclude=None):
+        base_forget(self.base)
+        for widget in self.widgets:
+            if widget is not exclude:
+                widget.grid_forget()
+    forgetter.__doc__ = ".{}() the base widget and .grid_forget() the subwidgets".format(forget)
+    return wrapper, forgetter
 
 
+@_base_attributes
+@_geometry_methods(_containing_geometry_methods)
 class ContainingWidget(tk.Widget):
     """Provide a widget that includes other widgets.
 
@@ -33,6 +180,8 @@ class ContainingWidget(tk.Widget):
         `widgets` are (<class>, <kwargs>) of the contined widgets
             if positional arguemnts are needed, they may be included
             under the key '*args' (clash-safe)
+            alternatively, and preferably, they may be
+            WidgetSpec(<class>, <args>, <kwargs>)
         `direction` is a tuple of two elements, respectively one of
             (TOP, BOTTOM) or (RIGHT, LEFT) or the inverse
             and indicates in which direction the contained widgets
@@ -53,95 +202,77 @@ class ContainingWidget(tk.Widget):
         """
         self.base = base(master)
         self.base.container_widget = self
-        self.widgets = tuple(w[0](self.base,
-                                  *w[1].pop('*args', ()),
-                                  **w[1]) for w in widgets)
+        base_widget = self.base
+        created = []
+        for spec in widgets:
+            if not isinstance(spec, WidgetSpec):
+                cls, kw = spec
+                if '*args' in kw:
+                    # don't change the caller's dict, it may be reused
+                    kw = kw.copy()
+                    spec = WidgetSpec(cls, kw.pop('*args'), kw)
+                else:
+                    spec = WidgetSpec(cls, (), kw)
+            created.append(spec.cls(base_widget, *spec.args, **spec.kwargs))
+        self.widgets = tuple(created)
         self.direction = direction
         self.horizontal = horizontal
         self.vertical = vertical
+        self._coords = _grid_coordinates(direction, horizontal, vertical,
+                                         len(self.widgets))
 
     def __getattr__(self, name):
         if name == 'container_widget':
             raise AttributeError('{!r} has no attribute "container_widget"'.format(self))
-        return getattr(self.base, name)
-
-    @misc.temp_function
-    @staticmethod
-    def _geo_wrapper(name, forget):
-        def wrapper(self, *args, rcoords=None, **kwargs):
-            getattr(self.base, name)(*args, **kwargs)
-            return self.grid_subwidgets(rcoords)
-        wrapper.__name__ = name
-        wrapper.__doc__ = """.{}() the base widget and .grid() the subwidgets.
-
-                            respect the directions given in __init__
-                            pass *args and **kwargs to the base widget
-                            """.format(name)
-
-        def forgetter(self, exclude=None):
-            getattr(self.base, forget)()
-            for widget in self.widgets:
-                if widget is not exclude:
-                    widget.grid_forget()
-        forgetter.__name__ = forget
-        forgetter.__doc__ = ".{}() the base widget and .grid_forget() the subwidgets".format(forget)
-        return wrapper, forgetter
-
-    for name, forget in GEOMETRY_MANAGERS_FORGET:
-        locals()[name], locals()[forget] = _geo_wrapper(name, forget)
-    del _geo_wrapper
+        attr = getattr(self.base, name)
+        # methods of the base don't change, so they are looked up only once
+        if isinstance(attr, types.MethodType) and attr.__self__ is self.base:
+            self.__dict__[name] = attr
+        return attr
 
     def grid_subwidgets(self, rcoords):
-        """.grid() the subwidgets according to `self.direction`,
-                `self.horizontal` and `self.vertical`
+        """.grid() the subwidgets according to the `direction`,
+                `horizontal` and `vertical` given in __init__
 
             `rcoords` specifies a widget (identity comparison) that
                 will not have .grid() called upon it. Instead, the x and y
                 coordinates of its position on the grid will be returned
         """
-        # x and y Start,  Increment and Return
         xr, yr = -1, -1
-        if tk.RIGHT in self.direction:
-            xs = 0
-            xi = 1
-        elif tk.LEFT in self.direction:
-            if self.horizontal:
-                xs = self.horizontal - 1
-            else:
-                xs = len(self.widgets) - 1
-            xi = -1
-        if tk.TOP in self.direction:
-            if self.vertical:
-                ys = self.vertical - 1
-            else:
-                ys = len(self.widgets) - 1
-            yi = -1
-        elif tk.BOTTOM in self.direction:
-            ys = 0
-            yi = 1
-        try:
-            xs, ys
-        except NameError:
-            raise ValueError('`direction` must be of the form specified in __init__')
-        x, y = xs, ys
-        for widget in self.widgets:
+        # plain widgets are gridded together, to save round trips to Tcl
+        batch = []
+        for widget, (x, y) in zip(self.widgets, self._coords):
             if widget is rcoords:
                 xr, yr = x, y
+            elif type(widget).grid is tk.Widget.grid:
+                batch.extend((widget._w, y, x))
             else:
                 widget.grid(row=y, column=x)
-            if self.direction[0] in (tk.RIGHT, tk.LEFT):
-                x += xi
-            elif self.direction[0] in (tk.TOP, tk.BOTTOM):
-                y += yi
-            if y in (-1, self.vertical or None):
-                y = ys
-                x += xi
-            if x in (-1, self.horizontal or None):
-                x = xs
-                y += yi
+        if batch:
+            _grid_many(self.base.tk, batch)
         return xr, yr
 
 
+def _proxy_geometry_methods(name, forget):
+    """geometry manager methods for BaseProxyWidget"""
+    def wrapper(self, *args, **kwargs):
+        containers = self._containers_reversed
+        x, y = getattr(containers[0], name)(*args, rcoords=self, **kwargs)
+        for container in containers[1:]:
+            x, y = container.grid(row=y, column=x, rcoords=self)
+        if (x, y) != (-1, -1):
+            type(self)._super_grid(self, row=y, column=x)
+
+    def forgetter(self):
+        containers = self._containers_reversed
+        getattr(containers[0], forget)(self)
+        for container in containers[1:]:
+            container.grid_forget(self)
+        type(self)._super_grid_forget(self)
+    return wrapper, forgetter
+
+
+@_geometry_methods(_proxy_geometry_methods)
 class BaseProxyWidget(tk.Widget):
     """Provide a widget that delegates some lookups to a .container
         in a way compatible with ContainingWidget
@@ -157,6 +288,15 @@ class BaseProxyWidget(tk.Widget):
         i.e. The method will first be passed to self.container and executed
             on super() at the second call
     """
+    # what super().grid and super().grid_forget give in the wrappers below,
+    # resolved once per class in __init_subclass__
+    _super_grid = tk.Widget.grid
+    _super_grid_forget = tk.Widget.grid_forget
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._super_grid = super(BaseProxyWidget, cls).grid
+        cls._super_grid_forget = super(BaseProxyWidget, cls).grid_forget
 
     def __init__(self, *args, container=None, **kwargs):
         """Create a new ProxyWidget. `container` is the container,
@@ -169,33 +309,8 @@ class BaseProxyWidget(tk.Widget):
         if container is not None:
             self.container = container
             self.container_list.append(container)
-
-    @misc.temp_function
-    @staticmethod
-    def _geo_wrapper(name, forget):
-        def wrapper(self, *args, **kwargs):
-            self.__visible = True
-            container_list = reversed(self.container_list)
-            x, y = getattr(next(container_list), name
-                           )(*args, rcoords=self, **kwargs)
-            for container in container_list:  # is an iterator
-                x, y = container.grid(row=y, column=x, rcoords=self)
-            if (x, y) != (-1, -1):
-                super().grid(row=y, column=x)
-
-        def forgetter(self):
-            container_list = reversed(self.container_list)
-            getattr(next(container_list), forget)(self)
-            for container in container_list:
-                container.grid_forget(self)
-            super().grid_forget()
-        wrapper.__name__ = name
-        forgetter.__name__ = forget
-        return wrapper, forgetter
-
-    for name, forget in GEOMETRY_MANAGERS_FORGET:
-        locals()[name], locals()[forget] = _geo_wrapper(name, forget)
-    del _geo_wrapper
+        # outermost container first, as used by the geometry methods
+        self._containers_reversed = self.container_list[::-1]
 
 
 class ProxyWidget(BaseProxyWidget):
@@ -205,6 +320,8 @@ class ProxyWidget(BaseProxyWidget):
 class BaseWrappedWidget(BaseProxyWidget):
     """Provide a widget that is contained inside a
         ContainingWidget along others but provides normal access"""
+    # classes are only kept while in use, wrapped classes may be temporary
+    _wrapped_classes = weakref.WeakValueDictionary()
 
     def __new__(cls, master, main_widget, *auxiliary_widgets, container_kw={}):
         """Create a new WrappedWidget.
@@ -214,9 +331,32 @@ class BaseWrappedWidget(BaseProxyWidget):
             is accessible through .container
 
         `main_widget` and each of the `auxiliary_widgets`
-            are (<class>, <kwargs>)
+            are (<class>, <kwargs>) or WidgetSpec instances
         """
-        main_cls, main_kw = main_widget
+        if isinstance(main_widget, WidgetSpec):
+            main_widget = main_widget._replace(
+                cls=cls._wrapped_class(main_widget.cls))
+        else:
+            main_cls, main_kw = main_widget
+            main_widget = (cls._wrapped_class(main_cls), main_kw)
+        container = ContainingWidget(master,
+                                     main_widget,
+                                     *auxiliary_widgets,
+                                     **container_kw)
+        self = container.widgets[0]
+        self.proxy_init(container)
+        # the widget is initialized by the container,
+        # don't do it again when it's returned from here
+        self._wrapped_initialized = True
+        return self
+
+    @classmethod
+    def _wrapped_class(cls, main_cls):
+        """get the (cached) class used for wrapping `main_cls`"""
+        try:
+            return BaseWrappedWidget._wrapped_classes[cls, main_cls]
+        except KeyError:
+            pass
         if main_cls in cls.mro():
             # multiple wrapping
             bases = (main_cls,)
@@ -225,27 +365,29 @@ class BaseWrappedWidget(BaseProxyWidget):
         else:
             bases = (cls, main_cls)
         if main_cls.__new__ is object.__new__:
-            def __new__(cls, *si, **nk):
-                return object.__new__(cls)
+            __new__ = _plain_new
         else:
             __new__ = main_cls.__new__
-        main_cls = type('Wrapped' + main_cls.__name__,
-                        bases,
-                        {'__new__': __new__})
-        container = ContainingWidget(master,
-                                     (main_cls, main_kw),
-                                     *auxiliary_widgets,
-                                     **container_kw)
-        self = container.widgets[0]
-        self.proxy_init(container)
-        type(self).__init__ = lambda *si, **nk: None
-        return self
+
+        def __init__(self, *args, **kwargs):
+            if not vars(self).get('_wrapped_initialized', False):
+                super(wrapped, self).__init__(*args, **kwargs)
+        wrapped = type('Wrapped' + main_cls.__name__,
+                       bases,
+                       {'__new__': __new__, '__init__': __init__})
+        BaseWrappedWidget._wrapped_classes[cls, main_cls] = wrapped
+        return wrapped
 
 
 class WrappedWidget(BaseWrappedWidget):
     pass
 
 
+# ContainingWidget direction for each label position
+_LABEL_DIRECTIONS = {tk.LEFT: (tk.LEFT, tk.TOP), tk.RIGHT: (tk.RIGHT, tk.TOP),
+                     tk.TOP: (tk.TOP, tk.BOTTOM), tk.BOTTOM: (tk.BOTTOM, tk.BOTTOM)}
+
+
 class LabeledWidget(BaseWrappedWidget):
     """Convenience class for widgets to be displayed with a Label
 
@@ -264,8 +406,8 @@ class LabeledWidget(BaseWrappedWidget):
                 direction chosen for the position.
             `options` are passed
         """
-        kw = {'direction': (position, (tk.TOP if position in (tk.LEFT, tk.RIGHT) else tk.BOTTOM))}
-        kw.update(options)
+        kw = {'direction': _LABEL_DIRECTIONS.get(position, (position, tk.BOTTOM)),
+              **options}
         self = super().__new__(cls, master, widget, (tk.Label, {'text': text}),
                                container_kw=kw)
         labels = {label_id: self.container.widgets[1]}
@@ -297,12 +439,45 @@ class ScrollableWidget:
         +-------------------------------------------------+
     """
 
+    # classes are only kept while in use, wrapped classes may be temporary
+    _classes = weakref.WeakValueDictionary()
+
     def __init__(self, direction=tk.VERTICAL, width=None, height=None):
         self.direction = {tk.VERTICAL: 'y', tk.HORIZONTAL: 'x'}[direction]
         self.width = width
         self.height = height
 
     def __call__(self, wrapped_cls):
+        key = (wrapped_cls, self.direction, self.width, self.height)
+        try:
+            return ScrollableWidget._classes[key]
+        except KeyError:
+            pass
+        # names and the scrollbar sticky only depend on the direction
+        scrollcommand = self.direction + 'scrollcommand'
+        view = self.direction + 'view'
+        view_scroll = self.direction + 'view_scroll'
+        sticky = {'y': tk.NS, 'x': tk.EW}[self.direction]
+
+        def geometry_methods(name, forget):
+            # what super() would give, NewClass' first base is ProxyWidget
+            proxy_method = getattr(ProxyWidget, name)
+
+            def wrapper(self, *args, **kwargs):
+                proxy_method(self, *args, **kwargs)
+                if isinstance(self, ContainingWidget):
+                    self.grid_subwidgets(None)
+                if isinstance(self, BaseWrappedWidget):
+                    x, y = self.master.container_widget.grid_subwidgets(self)
+                    tk.Grid.grid(self, row=y, column=x)
+                self.container.widgets[1].grid(row=0, column=1, sticky=sticky)
+
+            container_forget = operator.methodcaller(forget)
+
+            def wrapper_forget(self):
+                container_forget(self.container)
+            return wrapper, wrapper_forget
+
         class NewClass(ProxyWidget, wrapped_cls):
             def __new__(cls, master, *a, **kw):
                 container = ContainingWidget(master,  # attention: order matters and is used
@@ -311,8 +486,8 @@ class ScrollableWidget:
                                              (tk.Scrollbar, {})
                                              )
                 canvas, scrollbar = container.widgets
-                canvas.config(**{self.direction + 'scrollcommand': scrollbar.set})
-                scrollbar.config(command=getattr(canvas, self.direction + 'view'))
+                canvas.config(**{scrollcommand: scrollbar.set})
+                scrollbar.config(command=getattr(canvas, view))
                 if wrapped_cls.__new__ is object.__new__:
                     inst = object.__new__(cls)
                 else:
@@ -325,9 +500,9 @@ class ScrollableWidget:
                 canvas = self.container.widgets[0]
                 super().__init__(canvas, *args, container=self.container, **kwargs)
                 canvas.create_window((0, 0), window=self)
+                self._scroll_size = None
                 self.set_scrollregion()
-                canvas.bind('<Configure>', self.set_scrollregion)
-                self.bind('<Configure>', self.set_scrollregion)
+                self.bind('<Configure>', self._on_configure)
                 self.bind_all('<MouseWheel>', self.global_scroll, add=True)
                 self.bind_all('<Button-4>', self.global_scroll, add=True)
                 self.bind_all('<Button-5>', self.global_scroll, add=True)
@@ -336,6 +511,13 @@ class ScrollableWidget:
                 canvas = self.container.widgets[0]
                 canvas.config(scrollregion=canvas.bbox('all'))
 
+            def _on_configure(self, event):
+                # the scroll region only depends on the size of this widget
+                size = (event.width, event.height)
+                if size != self._scroll_size:
+                    self._scroll_size = size
+                    self.set_scrollregion()
+
             def global_scroll(self, event):
                 # https://stackoverflow.com/questions/17355902
                 # for this and evet bindings
@@ -346,35 +528,15 @@ class ScrollableWidget:
                     # widget destoryed
                     is_subwidget = False
                 if is_subwidget:
-                    f = getattr(canvas, self.scroll_direction + 'view_scroll')
+                    f = getattr(canvas, view_scroll)
                     f((event.delta > 0 or event.num == 5)*2 - 1, 'units')
 
-            @misc.temp_function
-            @staticmethod
-            def _geo_wrapper(name, forget):
-                def wrapper(self, *args, **kwargs):
-                    getattr(super(), name)(*args, **kwargs)
-                    if isinstance(self, ContainingWidget):
-                        self.grid_subwidgets(None)
-                    if isinstance(self, BaseWrappedWidget):
-                        x, y = self.master.container_widget.grid_subwidgets(self)
-                        tk.Grid.grid(self, row=y, column=x)
-                    sticky = {'y': tk.NS, 'x': tk.EW}[self.scroll_direction]
-                    self.container.widgets[1].grid(row=0, column=1, sticky=sticky)
-                wrapper.__name__ = name
-
-                def wrapper_forget(self):
-                    getattr(self.container, forget)()
-                wrapper_forget.__name__ = forget
-                return wrapper, wrapper_forget
-
-            for name, forget in GEOMETRY_MANAGERS_FORGET:
-                locals()[name], locals()[forget] = _geo_wrapper(name, forget)
-            del _geo_wrapper
-
         NewClass.__name__ = 'Scrollable' + wrapped_cls.__name__
         NewClass.__qualname__ = '.'.join(NewClass.__qualname__.rsplit('.', 1)[:-1]
                                          + [NewClass.__name__])
+        # applied after renaming, for the methods' __qualname__
+        NewClass = _geometry_methods(geometry_methods)(NewClass)
+        ScrollableWidget._classes[key] = NewClass
         return NewClass
 
 
@@ -418,6 +580,10 @@ def get_setter(widget, setter=None):
 
 class ValidatedWidget(tk.Widget):
     """A widget which validates its input"""
+    # classes are only kept while in use, since validators are often
+    # lambdas which would otherwise pile up here
+    _classes = weakref.WeakValueDictionary()
+
     @classmethod
     def new_cls(cls, widget, validator, getter=None):
         """Create a new widget class
@@ -428,7 +594,18 @@ class ValidatedWidget(tk.Widget):
             `getter` provides the name of the function to use for getting
                 input from the widget. If it is None, .get() and
                 .curselection() are tried
+
+            classes are reused for the same arguments as long as they exist
         """
+        key = (cls, widget, validator, getter)
+        try:
+            return ValidatedWidget._classes[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable validator or getter
+            key = None
+        getter = get_getter(widget, getter)
 
         def __init__(self, *args, validator=None, **kw):
             """Initialize self.
@@ -443,9 +620,11 @@ class ValidatedWidget(tk.Widget):
                     (cls, widget),
                     {'__new__': object.__new__,
                         '__init__': __init__,
-                        'getter': get_getter(widget, getter),
+                        'getter': getter,
                         'validator': staticmethod(validator)}
                     )
+        if key is not None:
+            ValidatedWidget._classes[key] = r
         return r
 
     @classmethod
@@ -470,11 +649,23 @@ class RadioChoiceWidget(ContainingWidget):  # yay, no class creation magic, just
             if `default` is not None, the `default`th (0-index) one will be selected
             `container_kw` will be passed along and may
                 e.g. be used to specify directions
+            if a default is selected and all codes are int or all are str,
+                the variable is typed accordingly
         """
-        self.var = tk.Variable(master)
-        rbtn = []
-        for code, text in choices:
-            rbtn.append((tk.Radiobutton, {'value': code, 'text': text, 'variable': self.var}))
+        # without a selection, .get() has to give '' like an untyped variable
+        code_types = {type(code) for code, __ in choices}
+        if default is None:
+            var_cls = tk.Variable
+        elif code_types == {int}:
+            var_cls = tk.IntVar
+        elif code_types == {str}:
+            var_cls = tk.StringVar
+        else:
+            var_cls = tk.Variable
+        var = self.var = var_cls(master)
+        rbtn = [WidgetSpec(tk.Radiobutton, (),
+                           {'value': code, 'text': text, 'variable': var})
+                for code, text in choices]
         super().__init__(master, *rbtn, **container_kw)
         if default is not None:
             self.widgets[default].select()
@@ -126,11 +126,15 @@ class WidgetDialog(ExtendedDialog):
         """Create the Dialog body. called by tkinter.simpledialog.Dialog.__init__"""
         if self.text is not None:
             tk.Label(master, text=self.text).pack()
+        # `widget_kw` may be shared (e.g. the default), don't pop from it
+        widget_kw = self.widget_kw.copy()
         self.widget = self.widget_cls(master,
-                                      *self.widget_kw.pop('*args', ()),
-                                      **self.widget_kw)
+                                      *widget_kw.pop('*args', ()),
+                                      **widget_kw)
         self.widget.pack()
-        return super().body(master)
+        super().body(master)
+        # give the initial focus to the widget instead of the dialog
+        return self.widget
 
     def validate(self):
         """Try validation of the data with the widget's `.validate()` method""" 
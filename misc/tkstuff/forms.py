@@ -2,6 +2,8 @@
 
 import inspect
 import copy
+import functools
+import weakref
 import tkinter as tk
 import tkinter.messagebox as tk_msg
 from .. import tkstuff as mtk
@@ -108,22 +110,25 @@ class FormWidget(mtk.ContainingWidget):
         """
         self.ERROR_LABEL_ID = object()
         self.error_handle = error_handle
+        self._use_label = bool(self.ErrorHandle.LABEL & error_handle)
+        self._use_popup = bool(self.ErrorHandle.POPUP & error_handle)
+        self._use_custom = bool(self.ErrorHandle.CUSTOM & error_handle)
         self.onsubmit = onsubmit
         self.error_display_options = {'label_fg': 'red',
                                       'label_position': tk.RIGHT}
         self.error_display_options.update(error_display_options)
 
-        widget_keys = []
-        pass_widgets = []
-        for key, widget in widgets:
-            if self.ErrorHandle.LABEL & error_handle:
-                widget = (mtk.LabeledWidget,
-                          {'widget': widget,
-                           'text': '',
-                           'position': self.error_display_options['label_position'],
-                           'label_id': self.ERROR_LABEL_ID})
-            widget_keys.append(key)
-            pass_widgets.append(widget)
+        widget_keys = [key for key, widget in widgets]
+        if self._use_label:
+            position = self.error_display_options['label_position']
+            pass_widgets = [(mtk.LabeledWidget,
+                             {'widget': widget,
+                              'text': '',
+                              'position': position,
+                              'label_id': self.ERROR_LABEL_ID})
+                            for key, widget in widgets]
+        else:
+            pass_widgets = [widget for key, widget in widgets]
 
         if submit_button:
             sb_options = {'text': 'Submit', 'command': self.submit_action}
@@ -134,10 +139,19 @@ class FormWidget(mtk.ContainingWidget):
         options.update(container_options)
 
         super().__init__(master, *pass_widgets, **options)
-        self.widget_dict = {k: w for k, w in zip(widget_keys, self.widgets)}
+        self.widget_dict = dict(zip(widget_keys, self.widgets))
+        self._validators = {}
+        for k, w in self.widget_dict.items():
+            if k.startswith('ignore'):
+                continue
+            try:
+                self._validators[k] = w.validate
+            except AttributeError:
+                self._validators[k] = lambda w=w: (True, w.get())
 
-        for k in default_content.keys() & self.widget_dict.keys():
-            mtk.get_setter(self.widget_dict[k])(default_content[k])
+        for k, v in default_content.items():
+            if k in self.widget_dict:
+                mtk.get_setter(self.widget_dict[k])(v)
         if submit_on_return is FormWidget.SubmitOnReturn.LAST:
             self.widgets[-1].bind('<Return>', self.submit_action)
         elif submit_on_return is FormWidget.SubmitOnReturn.ALL:
@@ -158,40 +172,32 @@ class FormWidget(mtk.ContainingWidget):
         self.data = {}
         self.errors = collections.defaultdict(set)
         self.clean_data()
-        if self.ErrorHandle.LABEL & self.error_handle:
+        if self._use_label:
             options = {'fg': self.error_display_options['label_fg']}
             if self.error_display_options.get('label_font'):
                 options['font'] = self.error_display_options['label_font']
             for k, w in self.widget_dict.items():
                 w.labels[self.ERROR_LABEL_ID].config(
-                    text='\n'.join(self.errors[k]), **options)
-        if self.ErrorHandle.POPUP & self.error_handle:
+                    text='\n'.join(self.errors.get(k, ())), **options)
+        if self._use_popup and any(self.errors.values()):
+            resolver = self.error_display_options.get('popup_field_name_resolver',
+                                                      lambda txt: txt)
             text = [self.error_display_options.get('popup_intro', '')]
             for k, v in self.errors.items():
                 if v:
-                    text.append('{}: {}'.format(
-                        self.error_display_options.get('popup_field_name_resolver',
-                                                       lambda txt: txt)(k),
-                        '\n'.join(v)))
-            if len(text) > 1:
-                tk_msg.showerror(self.error_display_options.get('popup_title'),
-                                 '\n\n'.join(text))
-        if self.ErrorHandle.CUSTOM & self.error_handle:
+                    text.append('{}: {}'.format(resolver(k), '\n'.join(v)))
+            tk_msg.showerror(self.error_display_options.get('popup_title'),
+                             '\n\n'.join(text))
+        if self._use_custom:
             self.custom_error_handle()
-        return not any(e for e in self.errors.values())
+        return not any(self.errors.values())
 
     def clean_data(self):
         """Use the .validate() methods of elements to validate form data.
             Override to validate in a finer-grained way
 
             Ignore elements whose keys start with 'ignore'"""
-        for k, w in self.widget_dict.items():
-            if k.startswith('ignore'):
-                continue
-            try:
-                validator = w.validate
-            except AttributeError:
-                def validator(): return True, w.get()
+        for k, validator in self._validators.items():
             valid, data = validator()
             if valid:
                 self.data[k] = data
@@ -207,22 +213,27 @@ class FormWidget(mtk.ContainingWidget):
             self.onsubmit(self.data)
 
 
-class ProtoWidget(tuple):
-    DEFAULT_DATA = {'groups': (), 'opt': 'out'}
+@functools.lru_cache(maxsize=None)
+def _init_argspec(form_widget_cls):
+    """return (and remember) the argspec of `form_widget_cls.__init__`"""
+    return inspect.getfullargspec(form_widget_cls.__init__)
+
 
-    def __new__(cls, iterable=(), options={}):
-        self = super().__new__(cls, iterable)
+class ProtoWidget:
+    __slots__ = ('name', 'widget', 'groups', 'opt')
+    DEFAULT_DATA = {'groups': (), 'opt': 'out'}
 
-        data = cls.DEFAULT_DATA.copy()
+    def __init__(self, name, widget, options={}):
+        data = self.DEFAULT_DATA.copy()
         data.update(options)
-        data['groups'] = set(data['groups'])
-        for k, v in data.items():
-            setattr(self, k, v)
-        return self
+        self.name = name
+        self.widget = widget
+        self.groups = frozenset(data['groups'])
+        self.opt = data['opt']
 
     def use(self, widgets, groups):
-        return bool(self[0] in widgets or self.groups & groups
-                    ) ^ (self.opt == 'out')
+        return (self.name in widgets or not self.groups.isdisjoint(groups)
+                ) ^ (self.opt == 'out')
 
 
 class Form:
@@ -255,10 +266,11 @@ class Form:
 
             * depending on setting in element definition
         """
-        groups = set(groups)
+        groups = frozenset(groups)
         kwargs = cls.__formwidget_options.copy()
         kwargs.update(options)
-        widgets = [copy.deepcopy(w) for w in cls.__widgets if w.use(elements, groups)]
+        widgets = [(w.name, copy.deepcopy(w.widget))
+                   for w in cls.__widgets if w.use(elements, groups)]
         return cls.__form_class(master, *widgets, **kwargs)
 
     def __init_subclass__(cls, autogen_names=True, template=False):
@@ -357,15 +369,22 @@ class Form:
     @classmethod
     def __get_widgets(cls, autogen_names):
         def _get_element_data(name, thing):
-            if issubclass(type_hints.get(name, type(None)), Element):
-                return getattr(type_hints[name], 'data', {})
-            else:
-                try:
-                    return thing._misc_tk_form_element_data
-                except AttributeError:
-                    return None
-
-        type_hints = getattr(typing, 'get_type_hints', lambda c: {})(cls)
+            try:
+                return annotated_data[name]
+            except KeyError:
+                return getattr(thing, '_misc_tk_form_element_data', None)
+
+        # only the class' own annotations are relevant and they only need
+        # to be resolved (which is expensive) if given as strings
+        annotations = vars(cls).get('__annotations__')
+        annotated_data = {}
+        if annotations:
+            if any(isinstance(a, str) for a in annotations.values()):
+                type_hints = getattr(typing, 'get_type_hints', lambda c: {})(cls)
+                annotations = {k: type_hints.get(k) for k in annotations}
+            annotated_data = {k: getattr(v, 'data', {})
+                              for k, v in annotations.items()
+                              if isinstance(v, type) and issubclass(v, Element)}
         widgets = []
         name_getter = getattr(cls, 'get_name', lambda x: x)
         for name, value in cls.__dict__.items():
@@ -384,14 +403,14 @@ class Form:
                     'widget': widget,
                     'text': name_getter(name),
                     'label_id': '{}-{}-label'.format(cls, value)})
-            widgets.append(ProtoWidget((name, widget), data))
+            widgets.append(ProtoWidget(name, widget, data))
         return widgets
 
     @classmethod
     def __set_formwidget_prefs(cls):
         form_widget = vars(cls).get('FormWidget')
         if form_widget:
-            argspec = inspect.getfullargspec(FormWidget.__init__)
+            argspec = _init_argspec(FormWidget)
             # if we subclass a template, don't overwrite unless explicitly
             cls.__formwidget_options = getattr(
                 cls, '_Form__formwidget_options', {}).copy()
@@ -411,18 +430,35 @@ class Form:
 
 class Element:
     """A form element. Use as an annotation or as type (will create a subclass)"""
+    # classes are only kept while in use, like the ones in misc.tkstuff
+    _interned = weakref.WeakValueDictionary()
+
     def __new__(cls, thing=None, **options):
         """Mark as form element. May include options used by Form
 
             currently the only option:
             `groups` is a container of the groups the element belongs to.
                 see Form.__new__ fro information on how to use them
+
+            The created classes are reused for equal (hashable) arguments
+                while they exist, so separate calls may return the same class.
+                Changing that class changes it for all of them.
         """
+        key = (cls, thing, tuple(sorted(options.items())))
+        try:
+            return Element._interned[key]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable, don't intern
+            key = None
         if thing is None:
-            return type('ElementWithOptions', (cls,), {'data': options})
+            element = type('ElementWithOptions', (cls,), {'data': options})
         elif isinstance(thing, type):
-            return type(thing.__name__ + 'FormElement',
-                        (thing,),
-                        {'_misc_tk_form_element_data': options})
+            element = type(thing.__name__ + 'FormElement',
+                           (thing,),
+                           {'_misc_tk_form_element_data': options})
         else:
             raise TypeError('To use with widget classes')
+        if key is not None:
+            Element._interned[key] = element
+        return element
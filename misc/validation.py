@@ -45,6 +45,8 @@ class Validator:
 
 class MultiValidator:
     """Chain multiple validators"""
+    __slots__ = ('validators',)
+
     def __init__(self, *validators):
         """Create a new MultiValidator
 
@@ -52,7 +54,8 @@ class MultiValidator:
         self.validators = validators
 
     def __call__(self, value):
-        for validator in self.validators:
+        validators = self.validators
+        for validator in validators:
             good, value = validator(value)
             if not good:
                 return False, value
@@ -111,18 +114,21 @@ class TransformValidator:
             else:
                 self.configs.append(default_config)
             self.trans.append(t)
+        # all exceptions handled by a config, for use in an except clause
+        self.handled = [tuple(e for exc in cnf
+                              for e in (exc if isinstance(exc, tuple) else (exc,)))
+                        for cnf in self.configs]
 
     def __call__(self, value):
-        for trans, cnf in zip(self.trans, self.configs):
+        for trans, cnf, handled in zip(self.trans, self.configs, self.handled):
             try:
                 value = trans(value)
-            except Exception as e:
+            except handled as e:
                 for exc, msg in cnf.items():
                     if isinstance(e, exc):
                         return False, msg.format(__name__=trans.__name__,
                                                  value=value,
                                                  )
-                raise
         return True, value
 
 